@@ -1,10 +1,15 @@
 # Ace It or Face It (Tkinter GUI)
 from tkinter import *
 from tkinter import messagebox
+import argparse
+import asyncio
 import random
+import threading
 from PIL import Image, ImageTk
 import os
 
+from broadcast import Broadcaster, serve_spectators
+
 # ----------------------------
 # Config
 # ----------------------------
@@ -98,8 +103,9 @@ class Deck:
 
 # the APPLICATION CLASS
 class AceOrFaceApp:
-    def __init__(self, root: Tk):
+    def __init__(self, root: Tk, broadcaster=None):
         self.root = root
+        self.broadcaster = broadcaster  # optional spectator feed, see broadcast.py
         self.root.title("Ace it or Face it - Card Game")
         self.root.geometry(f"{WINDOW_W}x{WINDOW_H}")
         self.root.configure(background=BG)
@@ -269,6 +275,12 @@ class AceOrFaceApp:
         return self.img_cache[key]
 
     # ---------- Game Flow ----------
+    def _publish(self, kind, **fields):
+        if self.broadcaster is None:
+            return
+        self.broadcaster.publish(kind, score=self.score, lives=self.lives,
+                                 cards_left=self.deck.remaining(), **fields)
+
     def start_game(self, difficulty_name: str):
         # Initialize game state
         self.difficulty = difficulty_name
@@ -278,6 +290,7 @@ class AceOrFaceApp:
         self.pending_guess = None
 
         self.deck.reset()
+        self._publish("start", difficulty=self.difficulty)
 
         # Update UI
         self.difficulty_label.config(text=f"Difficulty: {self.difficulty}")
@@ -355,6 +368,7 @@ class AceOrFaceApp:
 
     def _resolve_draw_and_score(self):
         """Draw a card, reveal it, apply scoring/life rules, then either continue or game over."""
+        self._publish("guess", mode=self.current_mode, guess=self.pending_guess)
         card = self.deck.draw()
         if card is None:
             self._game_over(reason="Deck is empty!")
@@ -374,6 +388,7 @@ class AceOrFaceApp:
         rank = value_to_rank(value)
         category = category_from_value(value)
         self.reveal_text.config(text=f"Revealed: {rank} of {suit.capitalize()} ({category})")
+        self._publish("draw", card=f"{rank} of {suit.capitalize()}", category=category)
 
         # Score / lives based on mode and guess
         correct = False
@@ -392,6 +407,11 @@ class AceOrFaceApp:
         else:
             self.lives -= 1
 
+        points = 0
+        if correct:
+            points = SAFE_POINTS if self.current_mode == "safe" else RISK_POINTS
+        self._publish("score", correct=correct, points=points)
+
         self._update_status_labels()
         self._update_probability_hint()
 
@@ -414,6 +434,7 @@ class AceOrFaceApp:
         self.total_score += self.score
         if self.score > self.high_score:
             self.high_score = self.score
+        self._publish("game_over", reason=reason, high_score=self.high_score)
 
         self._update_status_labels()
 
@@ -449,7 +470,23 @@ class AceOrFaceApp:
         )
         self.hint_label.config(text=hint)
 
+def start_spectator_feed(broadcaster: Broadcaster, port: int):
+    """Serve spectators from an event loop on a background thread; Tk keeps the main thread."""
+    loop = asyncio.new_event_loop()
+    feed = serve_spectators(broadcaster, port=port)
+    threading.Thread(target=loop.run_until_complete, args=(feed,), daemon=True).start()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Ace or Face with a Tkinter window.")
+    parser.add_argument("--watch-port", type=int, help="let spectators watch on this TCP port")
+    args = parser.parse_args()
+
+    broadcaster = None
+    if args.watch_port is not None:
+        broadcaster = Broadcaster()
+        start_spectator_feed(broadcaster, args.watch_port)
+
     root = Tk()
-    app = AceOrFaceApp(root)
+    app = AceOrFaceApp(root, broadcaster)
     root.mainloop()
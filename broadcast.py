@@ -0,0 +1,257 @@
+# Ace It or Face It - live spectator feed
+import asyncio
+import json
+import threading
+
+SUBSCRIBER_QUEUE_SIZE = 64
+SPECTATOR_TIMEOUT = 30  # seconds a spectator may stop reading before being cut off
+
+
+# ------------------ Subscriber ------------------
+
+class Subscriber:
+    """One spectator. Holds a bounded queue of encoded events (bytes, one JSON line each)."""
+
+    def __init__(self, broadcaster, maxsize):
+        self.broadcaster = broadcaster
+        self.queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+        self.closed = False
+
+    def _offer(self, message):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow viewer: throw away the backlog and jump straight to the latest state.
+            # The snapshot already reflects the event we were trying to deliver.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.dropped += 1
+            self.queue.put_nowait(self.broadcaster.snapshot())
+
+    def _finish(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # still let the viewer see how the game ended before the feed stops
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            if self.queue.maxsize > 1:
+                self.queue.put_nowait(self.broadcaster.snapshot())
+            self.queue.put_nowait(None)
+
+    async def get(self):
+        """Next encoded event, or None once the feed is closed."""
+        return await self.queue.get()
+
+    def close(self):
+        self.broadcaster.unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+# ------------------ Broadcaster ------------------
+
+class Broadcaster:
+    """In-process pub/sub for a single game.
+
+    The game calls publish() for every guess, draw and score change. Each event is
+    encoded once and the same bytes are handed to every subscriber without awaiting,
+    so a slow viewer can never hold up the game loop.
+
+    publish() and close() may be called from any thread (e.g. the Tkinter GUI). The
+    game state is updated on the publishing thread under a lock; only the fan-out is
+    handed to the event loop the subscribers live on. subscribe() and the Subscriber
+    methods must run on that loop.
+    """
+
+    # kept for the whole game
+    GAME_FIELDS = ("score", "lives", "cards_left", "difficulty", "high_score", "reason")
+    # describe the current turn only; cleared when a new turn or game starts
+    TURN_FIELDS = ("mode", "guess", "card", "category", "correct", "points")
+
+    def __init__(self, queue_size=SUBSCRIBER_QUEUE_SIZE, loop=None):
+        self.queue_size = queue_size
+        self.subscribers = set()  # only touched on the subscribers' loop
+        self.state = {}
+        self.seq = 0
+        self._loop = loop
+        self._lock = threading.Lock()  # guards state, seq, _snapshot and _loop
+        self._snapshot = None  # cached encoding of self.state, rebuilt lazily
+
+    @staticmethod
+    def encode(event):
+        return (json.dumps(event, separators=(",", ":")) + "\n").encode()
+
+    def snapshot(self):
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self.encode({"type": "snapshot", **self.state})
+            return self._snapshot
+
+    def subscribe(self):
+        """Join the feed. The first message a new subscriber sees is the current snapshot.
+
+        An event published while joining can show up both in the snapshot and right
+        after it; viewers can skip any event whose seq is not above the snapshot's.
+        """
+        running = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = running
+                self.subscribers = set()
+            elif self._loop is not running:
+                raise RuntimeError("Broadcaster is already serving subscribers on another event loop")
+        sub = Subscriber(self, self.queue_size)
+        if self.state:
+            sub.queue.put_nowait(self.snapshot())
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        self.subscribers.discard(sub)
+        sub._finish()
+
+    def publish(self, kind, **fields):
+        with self._lock:
+            self.seq += 1
+            event = {"type": kind, "seq": self.seq, **fields}
+            self._apply(event)
+            loop = self._loop
+        if loop is None:
+            return  # nobody is watching; the state is kept for late joiners
+        self._call_on_loop(loop, self._fan_out, self.encode(event))
+
+    def close(self):
+        """End the feed; every subscriber's iterator stops after this."""
+        loop = self._loop
+        if loop is not None:
+            self._call_on_loop(loop, self._close)
+
+    def _call_on_loop(self, loop, fn, *args):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            fn(*args)
+            return
+        try:
+            loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            # the subscribers' loop has shut down; forget it so a new loop can subscribe
+            with self._lock:
+                if self._loop is loop:
+                    self._loop = None
+
+    def _apply(self, event):
+        kind = event["type"]
+        if kind in ("start", "guess"):
+            for field in self.TURN_FIELDS:
+                self.state.pop(field, None)
+        if kind == "start":
+            self.state.pop("reason", None)
+        self.state["seq"] = event["seq"]
+        self.state["last"] = kind
+        for field in self.GAME_FIELDS + self.TURN_FIELDS:
+            if field in event:
+                self.state[field] = event[field]
+        self._snapshot = None
+
+    def _fan_out(self, message):
+        for sub in self.subscribers:
+            sub._offer(message)
+
+    def _close(self):
+        subscribers, self.subscribers = self.subscribers, set()
+        for sub in subscribers:
+            sub._finish()
+
+
+# ------------------ Spectator streams ------------------
+
+async def stream_feed(sub, writer, timeout=SPECTATOR_TIMEOUT):
+    """Copy a subscriber's feed to a stream until the feed ends or the viewer stops reading."""
+    try:
+        async for message in sub:
+            writer.write(message)
+            await asyncio.wait_for(writer.drain(), timeout)
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        sub.close()
+
+
+async def serve_spectators(broadcaster, host="127.0.0.1", port=7778, timeout=SPECTATOR_TIMEOUT):
+    """Stream one game's feed to every client that connects to host:port."""
+    async def handle(reader, writer):
+        await stream_feed(broadcaster.subscribe(), writer, timeout)
+        writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+# ------------------ Demo ------------------
+
+class _QuietIO:
+    def write(self, text=""):
+        pass
+
+
+async def _spectate(sub, delay, counts):
+    async for _ in sub:
+        counts["received"] += 1
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def demo(spectators=2000, slow_every=10, queue_size=8):
+    """Play a bot game in front of a crowd; every slow_every-th spectator lags behind."""
+    import random
+    import time
+    from mainGame import AceOrFaceGame, GameStats
+
+    broadcaster = Broadcaster(queue_size)
+    counts = {"received": 0}
+    subs = [broadcaster.subscribe() for _ in range(spectators)]
+    tasks = [asyncio.create_task(_spectate(sub, 0.01 if i % slow_every == 0 else 0, counts))
+             for i, sub in enumerate(subs)]
+
+    game = AceOrFaceGame(GameStats(), broadcaster=broadcaster, lives=3, io=_QuietIO())
+    longest = 0.0
+    start = time.perf_counter()
+    game._publish("start")
+    while game.lives > 0 and game.deck.remaining() > 0:
+        t = time.perf_counter()
+        alive = game._resolve_draw_and_score("1", random.choice(["Ace", "Face", "Number"]))
+        longest = max(longest, time.perf_counter() - t)
+        await asyncio.sleep(0)  # let spectators run between turns
+        if not alive:
+            break
+    elapsed = time.perf_counter() - start
+
+    broadcaster.close()
+    await asyncio.gather(*tasks)
+    print(f"{spectators} spectators, {broadcaster.seq} events in {elapsed:.3f}s")
+    print(f"Slowest turn: {longest * 1000:.2f}ms | delivered: {counts['received']} "
+          f"| dropped: {sum(s.dropped for s in subs)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
@@ -1,5 +1,9 @@
+import argparse
+import asyncio
 import random
 
+from broadcast import Broadcaster, serve_spectators
+
 # ------------------ Card ------------------
 
 class Card:
@@ -74,6 +78,19 @@ class GameStats:
         return self.total_score / self.games_played
 
 
+# ------------------ I/O ------------------
+
+class ConsoleIO:
+    """Terminal I/O. The game only talks to an object like this, so it can be served elsewhere (see server.py)."""
+
+    def write(self, text=""):
+        print(text)
+
+    async def read(self, prompt):
+        # input() blocks, so run it off the event loop to keep spectators and other tasks going
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
 # ------------------ Game ------------------
 
 class AceOrFaceGame:
@@ -81,13 +98,23 @@ class AceOrFaceGame:
     RISK_POINTS = 30
     JOKER_BONUS = 5
 
-    def __init__(self, stats):
+    def __init__(self, stats, broadcaster=None, lives=None, io=None):
         self.deck = Deck()
         self.score = 0
         self.stats = stats
-        self.lives = self.choose_difficulty()
+        self.broadcaster = broadcaster  # optional spectator feed, see broadcast.py
+        self.io = io or ConsoleIO()
+        self.lives = lives  # asked for at the start of play() when not given
+        self.difficulty = None
 
-    def choose_difficulty(self):
+    def _publish(self, kind, **fields):
+        if self.broadcaster is None:
+            return
+        # every event carries the headline state so a snapshot is always current
+        self.broadcaster.publish(kind, score=self.score, lives=self.lives,
+                                 cards_left=self.deck.remaining(), **fields)
+
+    async def choose_difficulty(self):
         chosen= True
 
         mode_map={
@@ -95,18 +122,20 @@ class AceOrFaceGame:
             "2": 2,
             "3": 1
         } 
+        names = {"1": "Easy", "2": "Normal", "3": "Hard"}
         #dictionary used here to map user input to lives. better than a bunch of if statements.
         while chosen:
-            print("1 - Easy (3 lives)")
-            print("2 - Normal (2 lives)")
-            print("3 - Hard (1 life)")
-            choice = input(" Choose difficulty: > ")
+            self.io.write("1 - Easy (3 lives)")
+            self.io.write("2 - Normal (2 lives)")
+            self.io.write("3 - Hard (1 life)")
+            choice = await self.io.read(" Choose difficulty: > ")
             if choice in mode_map:
                 chosen = False
             else:
-                print("Invalid choice. Please enter 1, 2, or 3.")
+                self.io.write("Invalid choice. Please enter 1, 2, or 3.")
                 continue
 
+        self.difficulty = names[choice]
         return mode_map[choice]
 
 
@@ -120,40 +149,48 @@ class AceOrFaceGame:
         faces = sum(1 for c in self.deck.cards if c.rank in ["Jack", "Queen", "King"])
         numbers = sum(1 for c in self.deck.cards if c.rank and c.rank.isdigit())
 
-        print(f"Probability hint -> Ace: {aces/total:.0%}, "
-              f"Face: {faces/total:.0%}, Number: {numbers/total:.0%}")
+        self.io.write(f"Probability hint -> Ace: {aces/total:.0%}, "
+                      f"Face: {faces/total:.0%}, Number: {numbers/total:.0%}")
 
-    def play_round(self):
-        print("\n")
+    async def play_round(self):
+        self.io.write("\n")
         chose_mode = True
         while chose_mode == True:
-            print("1 - Safe Mode (Ace / Face / Number)")
-            print("2 - Risk Mode (Exact rank)")
-            mode = input("Choose mode: > ")
+            self.io.write("1 - Safe Mode (Ace / Face / Number)")
+            self.io.write("2 - Risk Mode (Exact rank)")
+            mode = await self.io.read("Choose mode: > ")
 
             if mode == "1":
-                guess = input("Predict category (Ace / Face / Number): ").capitalize()
+                guess = (await self.io.read("Predict category (Ace / Face / Number): ")).capitalize()
                 chose_mode = False
             elif mode == "2":
-                guess = input("Predict exact rank (e.g. Ace, 7, Queen): ").capitalize()
+                guess = (await self.io.read("Predict exact rank (e.g. Ace, 7, Queen): ")).capitalize()
                 chose_mode = False
             else:
-                print("Invalid mode selected. Try again.")
-            
+                self.io.write("Invalid mode selected. Try again.")
+
+        return self._resolve_draw_and_score(mode, guess)
+
+    def _resolve_draw_and_score(self, mode, guess):
+        self._publish("guess", mode="safe" if mode == "1" else "risk", guess=guess)
+
         card = self.deck.draw()
 
         if not card:
             return False
 
-        print(f"Drawn card: {card}")
+        self.io.write(f"Drawn card: {card}")
+        self._publish("draw", card=str(card), category=card.category())
 
         # Joker logic
         if card.is_joker:
             if random.choice([True, False]):
                 self.score += self.JOKER_BONUS
-                print(f"Joker bonus! +{self.JOKER_BONUS} points")
+                self.io.write(f"Joker bonus! +{self.JOKER_BONUS} points")
+                self._publish("joker", points=self.JOKER_BONUS)
             else:
-                print("Joker did nothing.")
+                self.io.write("Joker did nothing.")
+                self._publish("joker", points=0)
             return True
 
         # Check guess
@@ -168,54 +205,83 @@ class AceOrFaceGame:
                 self.score += self.RISK_POINTS
 
         if correct:
-            print("Correct guess!")
+            self.io.write("Correct guess!")
         else:
             self.lives -= 1
-            print("Wrong guess! Lost 1 life.")
+            self.io.write("Wrong guess! Lost 1 life.")
+
+        points = (self.SAFE_POINTS if mode == "1" else self.RISK_POINTS) if correct else 0
+        self._publish("score", correct=correct, points=points)
 
         return correct or self.lives > 0
 
-    def play(self):
-        print("\n=== Ace or Face ===")
+    async def play(self):
+        if self.lives is None:
+            self.lives = await self.choose_difficulty()
+
+        self.io.write("\n=== Ace or Face ===")
+        self._publish("start", difficulty=self.difficulty)
 
         while self.lives > 0 and self.deck.remaining() > 0:
-            print(f"\nScore: {self.score} | Lives: {self.lives} | Cards left: {self.deck.remaining()}")
+            self.io.write(f"\nScore: {self.score} | Lives: {self.lives} | Cards left: {self.deck.remaining()}")
             self.probability_hint()
 
-            if not self.play_round():
+            if not await self.play_round():
                 break
 
-        print("\n=== Game Over ===")
-        print(f"Final Score: {self.score}")
+        self.io.write("\n=== Game Over ===")
+        self.io.write(f"Final Score: {self.score}")
 
         self.stats.record_game(self.score)
-        print(f"High Score: {self.stats.high_score}")
-        print(f"Average Score: {self.stats.average_score():.2f}")
+        reason = "No lives left!" if self.lives <= 0 else "Deck is empty!"
+        self._publish("game_over", reason=reason, high_score=self.stats.high_score)
+        self.io.write(f"High Score: {self.stats.high_score}")
+        self.io.write(f"Average Score: {self.stats.average_score():.2f}")
 
 
 # ------------------ Main ------------------
 
-def main():
-    stats = GameStats()
+async def run_session(io, stats=None, broadcaster=None):
+    stats = stats or GameStats()
 
     while True:
-        game = AceOrFaceGame(stats)
-        game.play()
+        game = AceOrFaceGame(stats, broadcaster=broadcaster, io=io)
+        await game.play()
         correct= True
 
         while correct:
-            again = input("\nPlay again? (y/n): ").lower()
+            again = (await io.read("\nPlay again? (y/n): ")).lower()
             
             if again == "y":
                 correct= False
             elif again == "n":
-                print("Thanks for playing!")
+                io.write("Thanks for playing!")
                 return  # exit program completely
 
             else:
-                print("Invalid input. Please enter 'y' or 'n'.")
-                
-         
+                io.write("Invalid input. Please enter 'y' or 'n'.")
+
+
+async def play_cli(watch_port=None):
+    if watch_port is None:
+        await run_session(ConsoleIO())
+        return
+
+    # spectators are served from the same event loop while the player types
+    broadcaster = Broadcaster()
+    feed = asyncio.create_task(serve_spectators(broadcaster, port=watch_port))
+    try:
+        await run_session(ConsoleIO(), broadcaster=broadcaster)
+    finally:
+        broadcaster.close()
+        feed.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Ace or Face in the terminal.")
+    parser.add_argument("--watch-port", type=int, help="let spectators watch on this TCP port")
+    args = parser.parse_args()
+    asyncio.run(play_cli(args.watch_port))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,183 @@
+# Ace It or Face It - line-protocol server
+# Serves the CLI game to telnet-style clients, every session a coroutine on one event loop.
+import argparse
+import asyncio
+
+from broadcast import Broadcaster, stream_feed
+from mainGame import GameStats, run_session
+
+IDLE_TIMEOUT = 300  # seconds a player may sit at a prompt
+MAX_LINE = 1024     # longest line a client may send
+
+
+class IdleTimeout(Exception):
+    pass
+
+
+class LineTooLong(Exception):
+    pass
+
+
+class WatchRequest(Exception):
+    """The first line of a connection asked to spectate a game instead of playing."""
+
+    def __init__(self, game_id):
+        super().__init__(game_id)
+        self.game_id = game_id
+
+
+# ------------------ Connection I/O ------------------
+
+class StreamIO:
+    """Game I/O over an asyncio stream.
+
+    Output is buffered and only flushed when the game needs an answer, so a whole
+    turn (status, hint, menu and prompt) goes out in a single write.
+    """
+
+    def __init__(self, reader, writer, idle_timeout=IDLE_TIMEOUT):
+        self.reader = reader
+        self.writer = writer
+        self.idle_timeout = idle_timeout
+        self.buffer = []
+        self.lines = 0
+
+    def write(self, text=""):
+        self.buffer.append(text + "\n")
+
+    async def flush(self):
+        if self.buffer:
+            self.writer.write("".join(self.buffer).encode())
+            self.buffer.clear()
+        # waits only if the client has stopped reading and the transport is backed up;
+        # a client that never reads counts as idle
+        try:
+            await asyncio.wait_for(self.writer.drain(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            raise IdleTimeout() from None
+
+    async def read(self, prompt):
+        self.buffer.append(prompt)
+        await self.flush()
+        try:
+            line = await asyncio.wait_for(self.reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            raise IdleTimeout() from None
+        except ValueError:
+            # StreamReader reports a line over the limit as ValueError
+            raise LineTooLong() from None
+        if not line:
+            raise EOFError()
+        self.lines += 1
+        text = line.decode(errors="replace").rstrip("\r\n")
+        if self.lines == 1 and text.split()[:1] == ["watch"]:
+            raise WatchRequest(text[len("watch"):].strip())
+        return text
+
+
+# ------------------ Server ------------------
+
+class GameServer:
+    def __init__(self, host="127.0.0.1", port=7777, idle_timeout=IDLE_TIMEOUT, max_line=MAX_LINE):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.server = None
+        self.active = 0
+        self.sessions = 0
+        self.lines = 0
+        self.games = {}  # game number -> Broadcaster for every game being played
+
+    async def start(self, backlog=1024):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port,
+                                                 limit=self.max_line, backlog=backlog)
+        # port 0 asks the OS for a free one; report what we actually got
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def handle(self, reader, writer):
+        self.active += 1
+        self.sessions += 1
+        game_id = self.sessions
+        broadcaster = Broadcaster()
+        self.games[game_id] = broadcaster
+        io = StreamIO(reader, writer, self.idle_timeout)
+        io.write(f"Ace or Face - game #{game_id}. Answer 'watch <game>' to the first prompt to spectate instead.")
+        try:
+            try:
+                await run_session(io, GameStats(), broadcaster)
+            except WatchRequest as request:
+                del self.games[game_id]
+                await self.spectate(io, request.game_id)
+            await io.flush()
+        except IdleTimeout:
+            io.write("\nIdle for too long, goodbye.")
+            await self._try_flush(io)
+        except LineTooLong:
+            io.write("\nLine too long, goodbye.")
+            await self._try_flush(io)
+        except (EOFError, ConnectionError):
+            pass
+        finally:
+            self.active -= 1
+            self.lines += io.lines
+            self.games.pop(game_id, None)
+            broadcaster.close()
+            writer.close()
+            try:
+                await asyncio.wait_for(writer.wait_closed(), 1)
+            except asyncio.TimeoutError:
+                # unsent output to a client that isn't reading; drop it rather than wait
+                writer.transport.abort()
+            except ConnectionError:
+                pass
+
+    async def spectate(self, io, game_id):
+        if game_id:
+            broadcaster = self.games.get(int(game_id)) if game_id.isdigit() else None
+        else:
+            # plain 'watch' follows the newest game
+            broadcaster = self.games[max(self.games)] if self.games else None
+        if broadcaster is None:
+            io.write("No such game.")
+            return
+        await io.flush()
+        await stream_feed(broadcaster.subscribe(), io.writer, self.idle_timeout)
+
+    async def _try_flush(self, io):
+        # best effort goodbye; flush() raises IdleTimeout itself if idle_timeout is the shorter limit
+        try:
+            await asyncio.wait_for(io.flush(), min(1, self.idle_timeout))
+        except (asyncio.TimeoutError, IdleTimeout, ConnectionError):
+            pass
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Ace or Face over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port, args.idle_timeout)
+
+    async def run():
+        await server.start()
+        print(f"Serving Ace or Face on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\nServed {server.sessions} sessions, {server.lines} lines read.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Ace It or Face It - client swarm
+# Opens many concurrent sessions against server.py and reports connections, lines and draws per second.
+import argparse
+import asyncio
+import random
+import time
+
+from server import GameServer
+
+CATEGORIES = ["Ace", "Face", "Number"]
+RANKS = ["Ace"] + [str(n) for n in range(2, 11)] + ["Jack", "Queen", "King"]
+CLIENT_TIMEOUT = 60  # seconds one bot may take for all its games
+
+
+class SwarmStats:
+    def __init__(self):
+        self.connected = 0
+        self.finished = 0
+        self.failed = 0
+        self.lines = 0        # every answer sent: menu picks, guesses, play-again
+        self.draws = 0        # cards actually drawn, i.e. real game turns
+        self.connect_time = 0.0
+        self.last_connected = None
+
+
+# ------------------ Bot client ------------------
+
+async def play_client(host, port, games, stats, timeout=CLIENT_TIMEOUT):
+    """Play one bot session; one that stalls past timeout counts as failed."""
+    try:
+        await asyncio.wait_for(_play(host, port, games, stats), timeout)
+    except asyncio.TimeoutError:
+        stats.failed += 1
+
+
+async def _play(host, port, games, stats):
+    start = time.perf_counter()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        stats.failed += 1
+        return
+    stats.last_connected = time.perf_counter()
+    stats.connect_time += stats.last_connected - start
+    stats.connected += 1
+
+    games_left = games
+    answers = {
+        b"Choose difficulty: > ": lambda: random.choice("123"),
+        b"Choose mode: > ": lambda: random.choice("12"),
+        b"Predict category (Ace / Face / Number): ": lambda: random.choice(CATEGORIES),
+        b"Predict exact rank (e.g. Ace, 7, Queen): ": lambda: random.choice(RANKS),
+    }
+    buf = b""
+    try:
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            buf += data
+            if buf.endswith(b"Play again? (y/n): "):
+                games_left -= 1
+                answer = "y" if games_left > 0 else "n"
+            else:
+                answer = next((pick() for prompt, pick in answers.items() if buf.endswith(prompt)), None)
+                if answer is None:
+                    continue  # prompt not complete yet
+            stats.draws += buf.count(b"Drawn card: ")
+            buf = b""
+            writer.write(answer.encode() + b"\n")
+            stats.lines += 1
+        # anything but a normal goodbye (idle timeout, line too long, ...) is a failure
+        if b"Thanks for playing!" in buf:
+            stats.finished += 1
+        else:
+            stats.failed += 1
+    except ConnectionError:
+        stats.failed += 1
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# ------------------ Runner ------------------
+
+def raise_fd_limit():
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # macOS reports an unlimited hard limit but refuses it as a soft limit
+    target = 65536 if hard == resource.RLIM_INFINITY else hard
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+
+async def run_swarm(clients, games, host=None, port=None, timeout=CLIENT_TIMEOUT):
+    """Run the swarm. With no port given, an in-process server is started on the same loop."""
+    server = None
+    if port is None:
+        server = GameServer(port=0)
+        await server.start()
+        host, port = server.host, server.port
+
+    stats = SwarmStats()
+    start = time.perf_counter()
+    await asyncio.gather(*(play_client(host, port, games, stats, timeout) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    # all clients dial at once, so the connect phase ends with the last accepted one
+    connect_phase = (stats.last_connected - start) if stats.last_connected else 0.0
+
+    if server is not None:
+        server.server.close()
+        await server.server.wait_closed()
+    return stats, elapsed, connect_phase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Ace or Face server.")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=3, help="games each client plays")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="server to target (default: start one in-process)")
+    parser.add_argument("--timeout", type=float, default=CLIENT_TIMEOUT,
+                        help="seconds a client may take before it counts as failed")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    stats, elapsed, connect_phase = asyncio.run(run_swarm(args.clients, args.games, args.host, args.port,
+                                                              args.timeout))
+
+    print(f"Clients: {stats.connected} connected, {stats.finished} finished, {stats.failed} failed")
+    print(f"Elapsed: {elapsed:.2f}s (connecting: {connect_phase:.2f}s)")
+    if connect_phase:
+        print(f"Connections/s: {stats.connected / connect_phase:.0f}")
+    print(f"Lines/s: {stats.lines / elapsed:.0f}")
+    print(f"Draws/s: {stats.draws / elapsed:.0f}")
+    if stats.connected:
+        print(f"Average connect time: {stats.connect_time / stats.connected * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+import unittest
+
+from broadcast import Broadcaster
+
+
+def decode(message):
+    return None if message is None else json.loads(message)
+
+
+class BroadcasterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_subscriber_receives_events_in_order(self):
+        b = Broadcaster(queue_size=4)
+        sub = b.subscribe()
+        b.publish("start", score=0)
+        b.publish("guess", guess="Ace")
+        b.close()
+
+        messages = [decode(m) async for m in sub]
+        self.assertEqual([m["type"] for m in messages], ["start", "guess"])
+        self.assertEqual([m["seq"] for m in messages], [1, 2])
+
+    async def test_snapshot_on_join(self):
+        b = Broadcaster()
+        b.publish("start", score=0, lives=3, cards_left=54)
+        sub = b.subscribe()
+
+        first = decode(await sub.get())
+        self.assertEqual(first["type"], "snapshot")
+        self.assertEqual(first["lives"], 3)
+        self.assertEqual(first["cards_left"], 54)
+
+    async def test_new_guess_clears_previous_turn(self):
+        b = Broadcaster()
+        b.publish("guess", mode="safe", guess="Face", score=0)
+        b.publish("draw", card="King of Hearts", category="Face", score=0)
+        b.publish("score", correct=True, points=10, score=10)
+        b.publish("guess", mode="risk", guess="7", score=10)
+
+        state = decode(b.snapshot())
+        self.assertEqual(state["guess"], "7")
+        self.assertEqual(state["score"], 10)
+        for stale in ("card", "category", "correct", "points"):
+            self.assertNotIn(stale, state)
+
+    async def test_slow_subscriber_coalesces_to_latest_snapshot(self):
+        b = Broadcaster(queue_size=2)
+        sub = b.subscribe()
+        for score in range(5):
+            b.publish("score", score=score)
+        b.close()
+
+        messages = [decode(m) for m in [await sub.get(), await sub.get()]]
+        self.assertEqual(messages[0]["type"], "snapshot")
+        self.assertEqual(messages[0]["score"], 4)
+        self.assertIsNone(messages[1])
+        self.assertGreater(sub.dropped, 0)
+
+    async def test_close_with_single_slot_queue_still_ends_feed(self):
+        b = Broadcaster(queue_size=1)
+        sub = b.subscribe()
+        b.publish("score", score=1)
+        b.close()
+
+        self.assertIsNone(await sub.get())
+
+    async def test_publish_from_another_thread_lands_on_loop(self):
+        b = Broadcaster(queue_size=64)
+        sub = b.subscribe()
+        worker = threading.Thread(target=lambda: [b.publish("score", score=i) for i in range(10)])
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0)
+        b.close()
+        await asyncio.sleep(0)
+
+        messages = [decode(m) async for m in sub]
+        self.assertEqual([m["score"] for m in messages], list(range(10)))
+
+
+class LoopBindingTests(unittest.TestCase):
+    def test_state_stays_current_after_subscriber_loop_closes(self):
+        b = Broadcaster()
+
+        async def join():
+            return decode(await b.subscribe().get())
+
+        async def watch():
+            b.subscribe()
+
+        asyncio.run(watch())
+        b.publish("start", score=0, lives=3)
+        b.publish("score", score=10, lives=3)
+
+        snapshot = asyncio.run(join())
+        self.assertEqual(snapshot["score"], 10)
+        self.assertEqual(snapshot["seq"], 2)
+
+    def test_subscribe_from_another_running_loop_is_rejected(self):
+        b = Broadcaster()
+
+        async def watch():
+            b.subscribe()
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(watch(), loop).result()
+            with self.assertRaises(RuntimeError):
+                asyncio.run(watch())
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
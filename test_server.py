@@ -0,0 +1,234 @@
+import asyncio
+import json
+import socket
+import unittest
+
+from broadcast import Broadcaster
+from mainGame import GameStats, run_session
+from server import GameServer, StreamIO
+from swarm import SwarmStats, play_client
+
+PLAYER_ANSWERS = {
+    b"Choose difficulty: > ": b"3",
+    b"Choose mode: > ": b"1",
+    b"Predict category (Ace / Face / Number): ": b"Nope",
+    b"Play again? (y/n): ": b"n",
+}
+
+
+class ScriptedIO:
+    """Answers prompts from a table and records everything the game writes."""
+
+    def __init__(self, answers):
+        self.answers = answers  # prompt text -> replies, the last one repeats
+        self.output = []
+
+    def write(self, text=""):
+        self.output.append(text)
+
+    async def read(self, prompt):
+        self.output.append(prompt)
+        for key, replies in self.answers.items():
+            if key in prompt:
+                return replies.pop(0) if len(replies) > 1 else replies[0]
+        raise AssertionError(f"unexpected prompt {prompt!r}")
+
+
+class FakeWriter:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+    async def drain(self):
+        pass
+
+
+async def play_scripted(reader, writer):
+    """Answer every prompt from PLAYER_ANSWERS until the server hangs up."""
+    buf = b""
+    while True:
+        data = await reader.read(4096)
+        if not data:
+            return buf.decode()
+        buf += data
+        for prompt, answer in PLAYER_ANSWERS.items():
+            if buf.endswith(prompt):
+                writer.write(answer + b"\n")
+                break
+
+
+class RunSessionTests(unittest.IsolatedAsyncioTestCase):
+    async def test_play_again_loop_and_events(self):
+        io = ScriptedIO({
+            "Choose difficulty": ["3"],
+            "Choose mode": ["1"],
+            "Predict category": ["Nope"],
+            "Play again": ["maybe", "n"],
+        })
+        stats = GameStats()
+        broadcaster = Broadcaster()
+        events = []
+        broadcaster.publish = lambda kind, **fields: events.append((kind, fields))
+
+        await run_session(io, stats, broadcaster)
+
+        self.assertEqual(stats.games_played, 1)
+        self.assertIn("Invalid input. Please enter 'y' or 'n'.", io.output)
+        self.assertEqual(io.output[-1], "Thanks for playing!")
+        self.assertEqual(events[0], ("start", {"score": 0, "lives": 1, "cards_left": 54,
+                                               "difficulty": "Hard"}))
+        self.assertEqual(events[-1][0], "game_over")
+        self.assertEqual(events[-1][1]["reason"], "No lives left!")
+
+
+class StreamIOTests(unittest.IsolatedAsyncioTestCase):
+    async def test_output_goes_out_in_one_write_per_prompt(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"1\r\n")
+        writer = FakeWriter()
+        io = StreamIO(reader, writer, idle_timeout=1)
+
+        io.write("Score: 0")
+        io.write("1 - Safe Mode")
+        answer = await io.read("Choose mode: > ")
+
+        self.assertEqual(answer, "1")
+        self.assertEqual(writer.writes, [b"Score: 0\n1 - Safe Mode\nChoose mode: > "])
+
+    async def test_eof_raises(self):
+        reader = asyncio.StreamReader()
+        reader.feed_eof()
+        io = StreamIO(reader, FakeWriter(), idle_timeout=1)
+
+        with self.assertRaises(EOFError):
+            await io.read("> ")
+
+
+class GameServerTests(unittest.IsolatedAsyncioTestCase):
+    async def start_server(self, **options):
+        server = GameServer(port=0, **options)
+        await server.start()
+
+        async def stop():
+            server.server.close()
+            await server.server.wait_closed()
+
+        self.addAsyncCleanup(stop)
+        return server
+
+    async def wait_until(self, predicate, timeout=10):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not predicate():
+            if loop.time() > deadline:
+                self.fail("condition not reached in time")
+            await asyncio.sleep(0.05)
+
+    async def read_all(self, reader):
+        return (await asyncio.wait_for(reader.read(), 5)).decode()
+
+    async def test_normal_play_ends_with_goodbye(self):
+        server = await self.start_server(idle_timeout=5)
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        output = await asyncio.wait_for(play_scripted(reader, writer), 10)
+        writer.close()
+
+        self.assertTrue(output.endswith("Thanks for playing!\n"))
+        await self.wait_until(lambda: server.active == 0)
+
+    async def test_swarm_client_finishes(self):
+        server = await self.start_server(idle_timeout=5)
+        stats = SwarmStats()
+
+        await play_client(server.host, server.port, 2, stats, timeout=10)
+
+        self.assertEqual((stats.finished, stats.failed), (1, 0))
+
+    async def test_silent_client_is_disconnected(self):
+        server = await self.start_server(idle_timeout=0.2)
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        output = await self.read_all(reader)
+        writer.close()
+
+        self.assertTrue(output.endswith("Idle for too long, goodbye.\n"))
+
+    async def test_client_that_never_reads_is_disconnected(self):
+        server = await self.start_server(idle_timeout=0.2)
+        # small kernel buffers on both ends so the backlog reaches the server's transport quickly
+        server.server.sockets[0].setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        sock.connect((server.host, server.port))
+        sock.setblocking(False)
+        reader, writer = await asyncio.open_connection(sock=sock)
+
+        async def pipeline():
+            # every invalid difficulty re-sends the whole menu, so output piles up quickly
+            try:
+                while True:
+                    writer.write(b"9\n" * 1000)
+                    await writer.drain()
+            except ConnectionError:
+                pass
+
+        sender = asyncio.create_task(pipeline())
+        try:
+            await self.wait_until(lambda: server.sessions == 1 and server.active == 0, timeout=20)
+        finally:
+            sender.cancel()
+            writer.transport.abort()
+
+    async def test_long_line_is_rejected(self):
+        server = await self.start_server(idle_timeout=5, max_line=16)
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        writer.write(b"x" * 100 + b"\n")
+        output = await self.read_all(reader)
+        writer.close()
+
+        self.assertTrue(output.endswith("Line too long, goodbye.\n"))
+
+    async def test_client_hanging_up_ends_session(self):
+        server = await self.start_server(idle_timeout=5)
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.close()
+
+        await self.wait_until(lambda: server.sessions == 1 and server.active == 0)
+
+    async def test_spectator_watches_a_game(self):
+        server = await self.start_server(idle_timeout=5)
+        player_r, player_w = await asyncio.open_connection(server.host, server.port)
+        await player_r.readuntil(b"Choose difficulty: > ")
+        viewer_r, viewer_w = await asyncio.open_connection(server.host, server.port)
+        await viewer_r.readuntil(b"Choose difficulty: > ")
+        viewer_w.write(b"watch 1\n")
+        await self.wait_until(lambda: server.games[1].subscribers)
+
+        player_w.write(b"3\n")
+        await asyncio.wait_for(play_scripted(player_r, player_w), 10)
+        player_w.close()
+        feed = [json.loads(line) for line in (await self.read_all(viewer_r)).splitlines()]
+        viewer_w.close()
+
+        self.assertEqual(feed[0]["type"], "start")
+        self.assertEqual(feed[0]["difficulty"], "Hard")
+        self.assertEqual(feed[-1]["type"], "game_over")
+
+    async def test_watching_unknown_game(self):
+        server = await self.start_server(idle_timeout=5)
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        await reader.readuntil(b"> ")
+
+        writer.write(b"watch 42\n")
+        output = await self.read_all(reader)
+        writer.close()
+
+        self.assertEqual(output, "No such game.\n")
+
+
+if __name__ == "__main__":
+    unittest.main()